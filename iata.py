@@ -158,12 +158,14 @@ airports = {
 
 def getIataCode(city_name, airports):
     city_name = city_name.lower()
-    # Check for exact match first
-    if city_name in airports:
-        return airports[city_name]
-    # Perform partial match if no exact match
+    # Check for exact match first; the dict keys are already lowercase,
+    # so this is a single O(1) hash lookup
+    code = airports.get(city_name)
+    if code is not None:
+        return code
+    # Fall back to a partial match scan if no exact match
     for city, code in airports.items():
-        if city_name in city.lower():
+        if city_name in city:
             return code
     return "No matching airports found."
 
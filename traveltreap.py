@@ -1,168 +1,70 @@
 from tkinter import *
 from tkinter import ttk
-import random
-import subprocess
+import bisect
 import json
 import os
+import sys
+from itertools import islice
 
-# Define the node structure for the Treap data structure
-class TreapNode:
-    def __init__(self, location):
-        # Initialize node with location and random priority for treap balancing
-        self.location = location
-        self.priority = random.randint(1, 100)
-        self.left = None
-        self.right = None
+import marisa_trie
 
-# Define the Treap structure for efficient searching and balancing
-class Treap:
-    def __init__(self):
-        self.root = None
-
-    # Right rotation for balancing the treap
-    def rotateRight(self, root):
-        # Time Complexity: O(1)
-        # Explanation: This operation involves a constant number of pointer changes, independent of the Treap size.
-        leftChild = root.left
-        root.left = leftChild.right
-        leftChild.right = root
-        return leftChild
-
-    # Left rotation for balancing the treap
-    def rotateLeft(self, root):
-        # Time Complexity: O(1)
-        # Explanation: This operation also involves constant pointer changes, independent of Treap size.
-        rightChild = root.right
-        root.right = rightChild.left
-        rightChild.left = root
-        return rightChild
-
-    # Insert a location in the treap with priority-based balancing
-    def insert(self, root, location):
-        # Time Complexity: Average O(log N), Worst-case O(N)
-        # Explanation: On average, the insertion follows a path down the tree, like a binary search tree.
-        # Balancing might require rotations, but on average, these operations remain logarithmic.
-        if root is None:
-            return TreapNode(location)
-
-        if location < root.location:
-            root.left = self.insert(root.left, location)
-            if root.left.priority > root.priority:
-                root = self.rotateRight(root)
-        else:
-            root.right = self.insert(root.right, location)
-            if root.right.priority > root.priority:
-                root = self.rotateLeft(root)
-
-        return root
-
-    # Helper to insert a new node in the treap
-    def insertNode(self, location):
-        # Time Complexity: Average O(log N), Worst-case O(N)
-        # Explanation: Same as insert function since it just calls insert at the root.
-        self.root = self.insert(self.root, location)
-
-    # Search for nodes with locations matching the prefix in the treap
-    def search(self, root, prefix):
-        # Time Complexity: O(log N + M), where M is the number of matches found.
-        # Explanation: The search follows a path down the tree based on prefix, so it takes O(log N)
-        # time on average. Collecting results depends on the number of matches, represented by M.
-        if root is None:
-            return []
-
-        results = []
-        # Check if current location matches the prefix
-        if root.location.startswith(prefix):
-            results.append(root.location)
-
-        if prefix < root.location:
-            results += self.search(root.left, prefix)
-        else:
-            results += self.search(root.right, prefix)
-
-        return results
-
-    # External method to initiate prefix search in the treap
-    def searchPrefix(self, prefix):
-        # Time Complexity: O(log N + M)
-        # Explanation: This initiates the search from the root, so it shares the time complexity of the search function.
-        return self.search(self.root, prefix)
-
-# Define TrieNode structure for autocomplete functionality
-class TrieNode:
-    def __init__(self):
-        self.children = {}
-        self.is_end_of_word = False
-
-# Define Trie structure for efficient prefix-based search
-class Trie:
-    def __init__(self):
-        self.root = TrieNode()
-
-    # Insert a word into the Trie structure
-    def insert(self, word):
-        # Time Complexity: O(L), where L is the length of the word.
-        # Explanation: Each character of the word is inserted individually, so the insertion depends linearly on the word length.
-        current = self.root
-        word = word.lower()
-        for char in word:
-            if char not in current.children:
-                current.children[char] = TrieNode()
-            current = current.children[char]
-        current.is_end_of_word = True
-
-    # Search for all words with the specified prefix
-    def search(self, prefix):
-        # Time Complexity: O(L + M), where L is the prefix length and M is the number of matched words.
-        # Explanation: Searching the prefix takes O(L) time, and collecting results depends on the number of words found.
-        current = self.root
-        prefix = prefix.lower()
-        for char in prefix:
-            if char not in current.children:
-                return []
-            current = current.children[char]
-        return self.findWords(current, prefix)
-
-    # Recursively find all words in the Trie starting from a given node
-    def findWords(self, node, prefix):
-        # Time Complexity: O(M), where M is the number of words found.
-        # Explanation: Each word found in this recursive call is appended to the list, so time depends on word count.
-        words = []
-        if node.is_end_of_word:
-            words.append(prefix)
-
-        for char, child in node.children.items():
-            words += self.findWords(child, prefix + char)
-
-        return words
-
-# Main class to manage locations and integrate treap and trie
+# Main class to manage locations and integrate the sorted index and trie
 class LocationGraph:
     def __init__(self):
         self.locations = []
-        self.treap = Treap()
-        self.trie = Trie()
-
-    # Add new locations to both treap and trie
+        # Sorted list of canonical (lowercased, interned) keys backing both the
+        # prefix search and the autocomplete trie; bisect keeps it ordered on
+        # insert, and the static marisa trie is rebuilt lazily from it.
+        self._sorted = []
+        self._trie = None
+        self._dirty = True
+
+    # Add new locations to both the sorted index and trie
     def addLocations(self, newLocations):
-        # Time Complexity: O(L + log N)
-        # Explanation: Adding a location to the Trie takes O(L), and inserting it in the Treap takes O(log N) on average.
+        # Time Complexity: O(N)
+        # Explanation: bisect finds the slot in O(log N) but the list insert shifts elements;
+        # submissions are rare compared to keystroke-driven searches, so writes pay the cost.
         combinedLocation = f"{newLocations[0]} -> {newLocations[1]}"
-        self.treap.insertNode(combinedLocation)
-        self.trie.insert(combinedLocation)
+        # Normalize once; interning makes the sorted index's comparisons start
+        # with a pointer check instead of comparing long strings
+        key = sys.intern(combinedLocation.lower())
+        bisect.insort(self._sorted, key)
+        self._dirty = True
         self.locations.append(combinedLocation)
 
-    # Search for locations using the treap's prefix search
+    # Restore many saved locations at once
+    def bulk_load(self, restoredLocations):
+        # Time Complexity: O(N log N)
+        # Explanation: The trie is built once from the full word list instead of N incremental
+        # rebuilds, and the sorted index is extended and re-sorted in a single pass.
+        if not restoredLocations:
+            return
+        self.locations.extend(restoredLocations)
+        self._sorted.extend(sys.intern(location.lower()) for location in restoredLocations)
+        self._sorted.sort()
+        self._trie = marisa_trie.Trie(self._sorted)
+        self._dirty = False
+
+    # Search for locations with a lower-bound lookup and forward scan
     def searchLocations(self, prefix):
         # Time Complexity: O(log N + M)
-        # Explanation: This calls the Treap’s searchPrefix function, which has the same time complexity.
-        return self.treap.searchPrefix(prefix)
-
-    # Autocomplete location using trie structure
-    def autocomplete(self, prefix):
-        # Time Complexity: O(L + M)
-        # Explanation: This calls the Trie’s search function, which has the same time complexity.
-        return self.trie.search(prefix)
+        # Explanation: bisect_left finds the first location >= prefix in C, then the scan
+        # walks the contiguous run of matches.
+        out = []
+        i = bisect.bisect_left(self._sorted, prefix)
+        while i < len(self._sorted) and self._sorted[i].startswith(prefix):
+            out.append(self._sorted[i])
+            i += 1
+        return out
+
+    # Autocomplete location using the marisa trie; expects a lowercased prefix
+    def autocomplete(self, prefix, limit=10):
+        # Time Complexity: O(L + limit), plus an O(N) trie rebuild when locations changed since the last call.
+        # Explanation: The prefix walk runs inside the C++ trie, and iteration stops after `limit` matches.
+        if self._dirty:
+            self._trie = marisa_trie.Trie(self._sorted)
+            self._dirty = False
+        return list(islice(self._trie.iterkeys(prefix), limit))
 
 # Main application class for the GUI
 class App:
@@ -176,6 +78,22 @@ class App:
         # Initialize the location graph object
         self.location_graph = LocationGraph()
 
+        # Pending `after` callback id used to debounce autocomplete searches
+        self._search_after = None
+
+        # In-memory mirror of locations.json, loaded once so submissions
+        # never have to re-read the file
+        self._all_records = []
+        if os.path.exists("locations.json"):
+            with open("locations.json", "r") as json_file:
+                try:
+                    self._all_records = [json.loads(line) for line in json_file if line.strip()]
+                except json.JSONDecodeError:
+                    print("Error decoding JSON. Starting with an empty location list.")
+        self.location_graph.bulk_load(
+            [f"{record['arrival']} -> {record['destination']}" for record in self._all_records]
+        )
+
         # Label and input for arrival location
         self.label_arrival = Label(self.window, text="Enter arrival location:", bg="#f0f0f0")
         self.label_arrival.pack(pady=(20, 5))
@@ -224,8 +142,9 @@ class App:
 
     # Add locations to graph and JSON file, then reset inputs
     def submitLocations(self):
-        # Time Complexity: O(L + log N)
-        # Explanation: Adding to the Trie takes O(L) time, and inserting in the Treap takes O(log N) time.
+        # Time Complexity: O(N)
+        # Explanation: addLocations' bisect.insort shifts the sorted index in O(N); the record
+        # mirror append and JSON-line write are O(1).
         arrivalLocation = self.arrival_entry.get().strip()
         destinationLocation = self.destination_entry.get().strip()
 
@@ -233,21 +152,11 @@ class App:
             newLocations = [arrivalLocation, destinationLocation]
             self.location_graph.addLocations(newLocations)
 
-            # Handle JSON file
-            data = {"locations": []}
-            if os.path.exists("locations.json"):
-                with open("locations.json", "r") as json_file:
-                    try:
-                        content = json_file.read()
-                        if content.strip():
-                            data = json.loads(content)
-                    except json.JSONDecodeError:
-                        print("Error decoding JSON. Initializing with new data.")
-
-            data["locations"].append({"arrival": arrivalLocation, "destination": destinationLocation})
-
-            with open("locations.json", "w") as json_file:
-                json.dump(data, json_file)
+            # Record in memory and append one JSON line, leaving the rest of the file untouched
+            record = {"arrival": arrivalLocation, "destination": destinationLocation}
+            self._all_records.append(record)
+            with open("locations.json", "a") as json_file:
+                json_file.write(json.dumps(record) + "\n")
 
             # Reset entry fields
             self.arrival_entry.delete(0, END)
@@ -256,17 +165,32 @@ class App:
             # Display confirmation message
             self.result_label.configure(text=f"Locations added: {newLocations}")
 
-    # Handle prefix-based autocomplete suggestions as user types
+    # Debounce keystrokes so only the last one in a burst triggers a search
     def onSearch(self, event):
+        # Time Complexity: O(1)
+        # Explanation: Only schedules (or reschedules) the deferred search callback.
+        if self._search_after:
+            self.window.after_cancel(self._search_after)
+        self._search_after = self.window.after(120, self._doSearch)
+
+    # Handle prefix-based autocomplete suggestions once typing pauses
+    def _doSearch(self):
         # Time Complexity: O(L + M)
         # Explanation: Calls the Trie’s search function for autocomplete suggestions.
-        prefix = self.search_entry.get()
+        self._search_after = None
+        # Lowercase once here so the graph's structures never re-normalize
+        prefix = self.search_entry.get().lower()
         suggestions = self.location_graph.autocomplete(prefix)
 
-        # Update listbox with suggestions
-        self.autocomplete_listbox.delete(0, END)
-        for suggestion in suggestions:
-            self.autocomplete_listbox.insert(END, suggestion)
+        # Update only the listbox rows that actually changed
+        current = self.autocomplete_listbox.get(0, END)
+        for i, suggestion in enumerate(suggestions):
+            if i >= len(current):
+                self.autocomplete_listbox.insert(END, suggestion)
+            elif current[i] != suggestion:
+                self.autocomplete_listbox.delete(i)
+                self.autocomplete_listbox.insert(i, suggestion)
+        self.autocomplete_listbox.delete(len(suggestions), END)
 
         # Toggle listbox display based on suggestions
         if suggestions:
@@ -274,11 +198,15 @@ class App:
         else:
             self.autocomplete_listbox.place_forget()
 
-    # Open external weather app
+    # Open the weather app in a new window within this process
     def openWeatherApp(self):
         # Time Complexity: O(1)
-        # Explanation: This simply opens an external application, so it has constant time complexity.
-        subprocess.Popen(["python", "weather_treap.py"])
+        # Explanation: Opens a Toplevel window; no new interpreter is started.
+        # Imported lazily so the search window never pays for the weather app's
+        # dependencies unless this button is used
+        from weather_treap import WeatherApp
+        weather_window = Toplevel(self.window)
+        WeatherApp(weather_window, locations=self.location_graph.locations)
 
 # Create the Tkinter root and start the application
 root = Tk()
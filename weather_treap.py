@@ -3,9 +3,9 @@ from tkinter import ttk, messagebox
 import requests
 import os
 import json
+import threading
+import time
 from dotenv import load_dotenv
-from liveflight import getFlightDetails
-from iata import getIataCode, airports
 
 # Load environment variables from .env file
 load_dotenv()
@@ -13,7 +13,10 @@ apiKey = os.getenv('weather_api')
 
 # Main class for the Weather Application
 class WeatherApp:
-    def __init__(self, root):
+    # How long a cached weather response stays fresh, in seconds
+    CACHE_TTL = 300
+
+    def __init__(self, root, locations=None):
         # Initialize the root Tkinter window with settings
         # Time Complexity: O(1)
         # Explanation: Initializes widgets without loops or data structure manipulation, so it takes constant time.
@@ -22,8 +25,17 @@ class WeatherApp:
         self.root.geometry("600x600")
         self.root.configure(bg="#f0f0f0")  # Set background color
 
-        # Load locations from JSON file
-        self.locations = self.loadLocations()
+        # Use the caller's location list when embedded, else load from the JSON file
+        self.locations = locations if locations is not None else self.loadLocations()
+
+        # Number of weather fetches still running in background threads
+        self._pendingFetches = 0
+
+        # Shared HTTP session so keep-alive amortizes TCP handshakes across fetches
+        self.session = requests.Session()
+
+        # Weather responses cached as locationName -> (fetch time, data)
+        self._weatherCache = {}
 
         # Create widgets
         self.createWidgets()
@@ -35,10 +47,9 @@ class WeatherApp:
         try:
             if os.path.exists("locations.json"):
                 with open("locations.json", "r") as jsonFile:
-                    content = jsonFile.read()
-                    if content.strip():  # Check if the file is not empty
-                        data = json.loads(content)
-                        return [f"{loc['arrival']} -> {loc['destination']}" for loc in data.get("locations", [])]
+                    # One JSON object per line; skip any blank lines
+                    records = [json.loads(line) for line in jsonFile if line.strip()]
+                    return [f"{loc['arrival']} -> {loc['destination']}" for loc in records]
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load locations: {e}")
         return []  # Return an empty list if file doesn't exist or is empty
@@ -89,41 +100,69 @@ class WeatherApp:
             self.loadingLabel.destroy()
 
     def fetchAndDisplayWeather(self, locationName):
-        # Fetch and display weather information for the specified location
-        # Time Complexity: O(1) for showing loading message, O(1) for API call initiation, O(M) for displaying results,
-        # where M is the number of elements in weatherData. Network time depends on response delay.
-        self.showLoadingMessage()  # Show loading message
+        # Kick off a background fetch for the specified location
+        # Time Complexity: O(1)
+        # Explanation: Shows the loading message and starts a daemon thread; the network
+        # round-trip happens off the main thread so the GUI stays responsive.
+        self._pendingFetches += 1
+
+        # Serve recent results from the cache without touching the network
+        timestamp, weatherData = self._weatherCache.get(locationName, (0, None))
+        if weatherData is not None and time.time() - timestamp < self.CACHE_TTL:
+            self._renderWeather(locationName, weatherData, None)
+            return
+
+        if self._pendingFetches == 1:
+            self.showLoadingMessage()  # Show loading message
+        threading.Thread(target=self._fetchWeather, args=(locationName,), daemon=True).start()
+
+    def _fetchWeather(self, locationName):
+        # Fetch weather data on a worker thread and hand the result to the main thread
+        # Time Complexity: O(1) plus network time; runs entirely off the Tk main loop.
         apiEndpoint = 'http://api.openweathermap.org/data/2.5/weather'
         url = f"{apiEndpoint}?appid={apiKey}&q={locationName}&units=metric"
 
         try:
-            # Make API request for weather data
-            response = requests.get(url)
+            # Make API request for weather data over the pooled session
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()  # Raise an error for bad responses
             weatherData = response.json()
+        except Exception as e:
+            self.root.after(0, self._renderWeather, locationName, None, e)
+        else:
+            # Timestamp the entry here, when the data actually came off the
+            # network, so cache hits never renew it past the TTL
+            self._weatherCache[locationName] = (time.time(), weatherData)
+            self.root.after(0, self._renderWeather, locationName, weatherData, None)
+
+    def _renderWeather(self, locationName, weatherData, error):
+        # Display a fetched weather result (or its error) on the main thread
+        # Time Complexity: O(M) for displaying results, where M is the number of elements in weatherData.
+        self._pendingFetches -= 1
+        if self._pendingFetches == 0:
+            self.removeLoadingMessage()  # Remove loading message
 
-            # Extract weather information
-            temperature = weatherData['main']['temp']
-            humidity = weatherData['main']['humidity']
-            description = weatherData['weather'][0]['description']
+        if error is not None:
+            self.displayErrorMessage(f"Could not fetch weather for {locationName}: {error}")
+            return
 
-            # Display weather info in the GUI
-            weatherInfo = f"Weather in {locationName}:\n" \
-                          f"Temperature: {temperature:.2f}°C\n" \
-                          f"Humidity: {humidity}%\n" \
-                          f"Description: {description}"
+        # Extract weather information
+        temperature = weatherData['main']['temp']
+        humidity = weatherData['main']['humidity']
+        description = weatherData['weather'][0]['description']
 
-            weatherLabel = tk.Label(self.weatherFrameInner, text=weatherInfo, justify="center", anchor="center", bg="#f0f0f0")
-            weatherLabel.pack(pady=10)
+        # Display weather info in the GUI
+        weatherInfo = f"Weather in {locationName}:\n" \
+                      f"Temperature: {temperature:.2f}°C\n" \
+                      f"Humidity: {humidity}%\n" \
+                      f"Description: {description}"
 
-            # Update the canvas with the new weather information
-            self.weatherFrameInner.update_idletasks()  # Update the layout
-            self.weatherCanvas.config(scrollregion=self.weatherCanvas.bbox("all"))
+        weatherLabel = tk.Label(self.weatherFrameInner, text=weatherInfo, justify="center", anchor="center", bg="#f0f0f0")
+        weatherLabel.pack(pady=10)
 
-        except Exception as e:
-            self.displayErrorMessage(f"Could not fetch weather for {locationName}: {e}")
-        finally:
-            self.removeLoadingMessage()  # Remove loading message
+        # Update the canvas with the new weather information
+        self.weatherFrameInner.update_idletasks()  # Update the layout
+        self.weatherCanvas.config(scrollregion=self.weatherCanvas.bbox("all"))
 
     def displayErrorMessage(self, message):
         # Display an error message in the frame
@@ -158,6 +197,11 @@ class WeatherApp:
         # Retrieve flight details based on selected departure and arrival locations
         # Time Complexity: O(1) for selection and verification, plus O(F) for IATA code lookup, where F is the complexity of getIataCode.
         # The call to getFlightDetails depends on how it processes IATA codes.
+        # Imported lazily so the airports table and flight module only load when
+        # flights are actually requested; Python caches them for later clicks
+        from liveflight import getFlightDetails
+        from iata import getIataCode, airports
+
         selectedLocation = self.comboBox.get()
         if selectedLocation:
             # Split the selected location into arrival and destination